@@ -1,14 +1,99 @@
+import os
+import numpy as np
 import pandas as pd
-import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from io import StringIO
+from typing import Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the pandas CSV writer
+    pa = None
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    """
+    Read a source dataset from CSV, using pyarrow's multithreaded parser and Arrow-backed dtypes when it is installed.
+
+    Parameters:
+    - path: Source file path.
+
+    Returns:
+    - A DataFrame with the CSV contents.
+    """
+    if pa is not None:
+        return pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow')
+    return pd.read_csv(path)
+
+
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a generated dataset to CSV, using pyarrow's columnar writer when it is installed.
+
+    Parameters:
+    - df: The DataFrame to write.
+    - path: Destination file path.
+    """
+    if pa is not None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, path, write_options=pa_csv.WriteOptions(batch_size=64 * 1024))
+    else:
+        df.to_csv(path, index=False, chunksize=16384)
+
 
 class QuantumWorkloadGenerator:
-    def __init__(self, available_dataset: pd.DataFrame):
+    def __init__(self, available_dataset: pd.DataFrame, rng: Optional[np.random.Generator] = None):
         self.available_datasets = available_dataset
-        
+        # Pass a seeded generator (e.g. np.random.default_rng(42)) for reproducible datasets
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Scenario number -> generator method, used by generate_workload
+        self._dispatch = {
+            1: self.generate_bursty_dataset,
+            2: self.simulate_regular_spikes,
+            3: self.simulate_ramp_up,
+            4: self.simulate_ramp_down,
+            5: self.generate_random_bursts,
+            6: self.map_invocation_times,
+        }
+
+    @property
+    def available_datasets(self) -> pd.DataFrame:
+        """
+        The source dataset that tasks are sampled from.
 
-    def generate_single_spike_dataset(self, num_qtasks: int, burst_duration: timedelta, normal_interval: timedelta, burst_tasks: int) -> pd.DataFrame:
+        Sampling reads column-wise NumPy copies taken when this attribute is assigned, so assign a new
+        DataFrame to change the source; in-place edits to the current DataFrame are not picked up.
+        """
+        return self._available_datasets
+
+    @available_datasets.setter
+    def available_datasets(self, available_dataset: pd.DataFrame) -> None:
+        self._available_datasets = available_dataset
+        # Column-wise NumPy copies so sampling is a plain array gather per column
+        self._cols = {c: available_dataset[c].to_numpy() for c in available_dataset.columns}
+        self._n = len(available_dataset)
+
+    def _build_workload(self, timestamps: np.ndarray, subset: bool = True) -> pd.DataFrame:
+        """
+        Randomly select one task (with replacement) from the available datasets per timestamp and build the workload in a single construction.
+
+        Parameters:
+        - timestamps: Arrival timestamps, one per task to select.
+        - subset: Whether to add the leading 'subset' column.
+
+        Returns:
+        - A DataFrame with the generated quantum workload dataset.
+        """
+        n = len(timestamps)
+        idx = self.rng.integers(0, self._n, n)
+        columns = {'subset': np.ones(n, dtype=np.int8)} if subset else {}
+        columns.update((c, v.take(idx)) for c, v in self._cols.items())
+        columns['timestamp'] = timestamps
+        return pd.DataFrame(columns)
+
+    def generate_single_spike_dataset(self, num_qtasks: int, burst_duration: timedelta, normal_interval: timedelta, burst_tasks: int, persist: bool = False) -> pd.DataFrame:
         """
         Generate a dataset with a sudden burst of tasks.
 
@@ -17,34 +102,32 @@ class QuantumWorkloadGenerator:
         - burst_duration: Duration of the burst period.
         - normal_interval: Time interval between tasks during normal periods.
         - burst_tasks: Number of tasks arriving within the burst duration.
+        - persist: Whether to also write the dataset to a CSV file.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        # Randomly select num_qtasks tasks from the available datasets
-        sample_df = self.available_datasets.sample(n=num_qtasks, replace=True)
-        
-        base_time = datetime.now()
-        timestamps = []
-        current_time = base_time
-
-        for _ in range(burst_tasks):  # First 40 tasks arrive within the burst duration
-            timestamp = current_time + timedelta(seconds=random.uniform(0, burst_duration.total_seconds()))
-            timestamps.append(timestamp.timestamp())
-            current_time = timestamp
-            
-        for _ in range(num_qtasks-burst_tasks):  # Next 10 tasks follow normal arrival rate
-            current_time += normal_interval
-            timestamps.append(current_time.timestamp())
-        # Ensure we have exactly num_qtasks timestamps
-        
-        # Add the timestamps to the DataFrame
-        sample_df['timestamp'] = timestamps
-        sample_df.insert(0, 'subset', 1)
-        sample_df.to_csv('single_spike_dataset.csv', index=False)
+        base_time = datetime.now().timestamp()
+        burst_duration_s = burst_duration.total_seconds()
+        normal_interval_s = normal_interval.total_seconds()
+
+        n_burst = min(burst_tasks, num_qtasks)
+        n_normal = num_qtasks - n_burst
+        timestamps = np.empty(num_qtasks, dtype=np.float64)
+        # Burst tasks arrive at random, ordered offsets within the burst duration
+        timestamps[:n_burst] = self.rng.uniform(0, burst_duration_s, n_burst)
+        timestamps[:n_burst].sort()
+        # Remaining tasks follow the normal arrival rate after the burst ends
+        timestamps[n_burst:] = burst_duration_s + np.arange(1, n_normal + 1) * normal_interval_s
+        timestamps += base_time
+
+        # Pair each timestamp with a randomly selected task
+        sample_df = self._build_workload(timestamps)
+        if persist:
+            _write_csv(sample_df, 'single_spike_dataset.csv')
         return sample_df
 
-    def generate_bursty_dataset(self, num_qtasks: int, burst_duration: timedelta, burst_tasks: int, low_activity_interval: timedelta) -> pd.DataFrame:
+    def generate_bursty_dataset(self, num_qtasks: int, burst_duration: timedelta, burst_tasks: int, low_activity_interval: timedelta, persist: bool = False) -> pd.DataFrame:
         """
         Generate a dataset with a sudden burst of tasks followed by low activity.
 
@@ -53,70 +136,74 @@ class QuantumWorkloadGenerator:
         - burst_duration: Duration of the burst period.
         - burst_tasks: Number of tasks arriving within the burst duration.
         - low_activity_interval: Time interval between tasks during low activity periods.
+        - persist: Whether to also write the dataset to a CSV file.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        sample_df = None
-        sample_df = self.available_datasets.sample(n=num_qtasks, replace=True)
-        base_time = datetime.now()
-        timestamps = []
-        current_time = base_time
+        base_time = datetime.now().timestamp()
+        burst_duration_s = burst_duration.total_seconds()
+        low_activity_interval_s = low_activity_interval.total_seconds()
+
+        n_burst = min(burst_tasks, num_qtasks)
+        n_low = num_qtasks - n_burst
+        timestamps = np.empty(num_qtasks, dtype=np.float64)
 
         # Generate burst tasks
-        for _ in range(burst_tasks):
-            if len(timestamps) >= num_qtasks:
-                break
-            timestamps.append(current_time.timestamp())
-            current_time += timedelta(seconds=random.uniform(0, burst_duration.total_seconds() / burst_tasks))
-        
+        timestamps[:n_burst] = self.rng.uniform(0, burst_duration_s, n_burst)
+        timestamps[:n_burst].sort()
+
         # Generate low activity tasks
-        while len(timestamps) < num_qtasks:
-            timestamps.append(current_time.timestamp())
-            current_time += low_activity_interval
+        timestamps[n_burst:] = burst_duration_s + np.arange(1, n_low + 1) * low_activity_interval_s
+        timestamps += base_time
 
-        sample_df['timestamp'] = timestamps[:num_qtasks]
-        sample_df.insert(0, 'subset', 1)
-        sample_df.to_csv('bursty_dataset.csv', index=False)
+        sample_df = self._build_workload(timestamps)
+        if persist:
+            _write_csv(sample_df, 'bursty_dataset.csv')
         return sample_df
 
-    def simulate_regular_spikes(self, num_qtasks: int, spike_interval: timedelta, spike_tasks: int, normal_interval: timedelta) -> pd.DataFrame:
+    def simulate_regular_spikes(self, num_qtasks: int, spike_interval: timedelta, spike_tasks: int, normal_interval: timedelta, persist: bool = False) -> pd.DataFrame:
         """
         Simulate regular spikes in the arrival rate of tasks at fixed intervals.
 
         Parameters:
         - num_qtasks: Number of qtasks to generate.
-        - spike_interval: Time interval between spikes.
+        - spike_interval: Time interval before each spike; tasks within a spike arrive at random gaps of up to spike_interval / spike_tasks.
         - spike_tasks: Number of tasks arriving during each spike.
         - normal_interval: Time interval between tasks during normal periods.
+        - persist: Whether to also write the dataset to a CSV file.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        sample_df = self.available_datasets.sample(n=num_qtasks, replace=True)
-        
-        base_time = datetime.now()
-        timestamps = []
-        current_time = base_time
-
-        for i in range(num_qtasks):
-            if i % spike_tasks == 0 and i != 0:
-                current_time += spike_interval
-                for _ in range(spike_tasks):
-                    if len(timestamps) >= num_qtasks:
-                        break
-                    timestamps.append(current_time.timestamp())
-                    current_time += timedelta(seconds=random.uniform(0, spike_interval.total_seconds() / spike_tasks))
-            else:
-                timestamps.append(current_time.timestamp())
-                current_time += normal_interval
-
-        sample_df['timestamp'] = timestamps[:num_qtasks]
-        sample_df.insert(0, 'subset', 1)
-        sample_df.to_csv("regular_spike_dataset.csv", index=False)
+        base_time = datetime.now().timestamp()
+        spike_interval_s = spike_interval.total_seconds()
+        normal_interval_s = normal_interval.total_seconds()
+
+        # Arrivals follow the pattern: spike_tasks normal tasks, a spike of spike_tasks tasks, then
+        # repeating [spike_tasks - 1 normal tasks, spike of spike_tasks tasks]. Task 0 is the extra
+        # leading normal task; the rest are laid out by (group, slot) within that repeating unit.
+        n_normal = spike_tasks - 1
+        group, slot = np.divmod(np.arange(num_qtasks) - 1, n_normal + spike_tasks)
+        is_spike = slot >= n_normal
+        is_spike[0] = False
+        prev_is_spike = np.zeros(num_qtasks, dtype=bool)
+        prev_is_spike[1:] = is_spike[:-1]
+
+        # Gap before each task: a short random gap after a spike task, the normal interval otherwise,
+        # plus one spike interval in front of each spike
+        gaps = np.full(num_qtasks, normal_interval_s)
+        gaps[prev_is_spike] = self.rng.uniform(0, spike_interval_s / spike_tasks, np.count_nonzero(prev_is_spike))
+        gaps[is_spike & (slot == n_normal)] += spike_interval_s
+        gaps[0] = 0
+        timestamps = base_time + np.cumsum(gaps)
+
+        sample_df = self._build_workload(timestamps)
+        if persist:
+            _write_csv(sample_df, "regular_spike_dataset.csv")
         return sample_df
 
-    def simulate_ramp_up(self, num_qtasks: int, initial_interval: timedelta, final_interval: timedelta) -> pd.DataFrame:
+    def simulate_ramp_up(self, num_qtasks: int, initial_interval: timedelta, final_interval: timedelta, persist: bool = False) -> pd.DataFrame:
         """
         Simulate ramp-up timestamps where the interval between tasks decreases over time.
 
@@ -124,28 +211,25 @@ class QuantumWorkloadGenerator:
         - num_qtasks: Number of qtasks to generate.
         - initial_interval: Initial time interval between tasks.
         - final_interval: Final time interval between tasks.
+        - persist: Whether to also write the dataset to a CSV file.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        sample_df = self.available_datasets.sample(n=num_qtasks, replace=True)
-        
-        base_time = datetime.now()
-        timestamps = []
-        current_time = base_time
+        base_time = datetime.now().timestamp()
 
-        interval_step = (initial_interval - final_interval) / (num_qtasks - 1)
+        # Interval i is initial_interval - i * step; task i arrives after the first i intervals
+        i = np.arange(num_qtasks, dtype=np.float64)
+        interval_step = (initial_interval - final_interval).total_seconds() / (num_qtasks - 1)
+        intervals = initial_interval.total_seconds() - i * interval_step
+        timestamps = base_time + np.cumsum(intervals) - intervals
 
-        for i in range(num_qtasks):
-            timestamps.append(current_time.timestamp())
-            current_time += initial_interval - i * interval_step
-
-        sample_df['timestamp'] = timestamps[:num_qtasks]
-        sample_df.insert(0, 'subset', 1)
-        sample_df.to_csv("ramp_up_dataset.csv", index=False)
+        sample_df = self._build_workload(timestamps)
+        if persist:
+            _write_csv(sample_df, "ramp_up_dataset.csv")
         return sample_df
 
-    def simulate_ramp_down(self, num_qtasks: int, initial_interval: timedelta, final_interval: timedelta) -> pd.DataFrame:
+    def simulate_ramp_down(self, num_qtasks: int, initial_interval: timedelta, final_interval: timedelta, persist: bool = False) -> pd.DataFrame:
         """
         Simulate ramp-down timestamps where the interval between tasks increases over time.
 
@@ -153,28 +237,25 @@ class QuantumWorkloadGenerator:
         - num_qtasks: Number of qtasks to generate.
         - initial_interval: Initial time interval between tasks.
         - final_interval: Final time interval between tasks.
+        - persist: Whether to also write the dataset to a CSV file.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        sample_df = self.available_datasets.sample(n=num_qtasks, replace=True)
-        
-        base_time = datetime.now()
-        timestamps = []
-        current_time = base_time
-
-        interval_step = (final_interval - initial_interval) / (num_qtasks - 1)
+        base_time = datetime.now().timestamp()
 
-        for i in range(num_qtasks):
-            timestamps.append(current_time.timestamp())
-            current_time += initial_interval + i * interval_step
+        # Interval i is initial_interval + i * step; task i arrives after the first i intervals
+        i = np.arange(num_qtasks, dtype=np.float64)
+        interval_step = (final_interval - initial_interval).total_seconds() / (num_qtasks - 1)
+        intervals = initial_interval.total_seconds() + i * interval_step
+        timestamps = base_time + np.cumsum(intervals) - intervals
 
-        sample_df['timestamp'] = timestamps[:num_qtasks]
-        #sample_df.insert(0, 'subset', 1)
-        sample_df.to_csv("ramp_down_dataset.csv", index = False)
+        sample_df = self._build_workload(timestamps, subset=False)
+        if persist:
+            _write_csv(sample_df, "ramp_down_dataset.csv")
         return sample_df
 
-    def generate_random_bursts(self, num_qtasks: int, burst_chance: float, burst_duration: timedelta, max_tasks_in_burst: int, normal_interval: timedelta) -> pd.DataFrame:
+    def generate_random_bursts(self, num_qtasks: int, burst_chance: float, burst_duration: timedelta, max_tasks_in_burst: int, normal_interval: timedelta, persist: bool = False) -> pd.DataFrame:
         """
         Generate timestamps with random bursts of high task arrivals.
 
@@ -184,126 +265,125 @@ class QuantumWorkloadGenerator:
         - burst_duration: Duration of each burst.
         - max_tasks_in_burst: Maximum number of tasks in a burst.
         - normal_interval: Time interval between tasks during normal periods.
+        - persist: Whether to also write the dataset to a CSV file.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        sample_df = self.available_datasets.sample(n=num_qtasks, replace=True)
-        
-        base_time = datetime.now()
-        timestamps = []
-        current_time = base_time
-
-        while len(timestamps) < num_qtasks:
-            if random.random() < burst_chance:
-                burst_end_time = current_time + burst_duration
-                for _ in range(random.randint(1, max_tasks_in_burst)):
-                    if len(timestamps) >= num_qtasks:
-                        break
-                    timestamps.append(current_time.timestamp())
-                    current_time += timedelta(seconds=random.uniform(0, burst_duration.total_seconds()))
-            else:
-                timestamps.append(current_time.timestamp())
-                current_time += normal_interval
-
-        sample_df['timestamp'] = timestamps[:num_qtasks]
-        sample_df.insert(0, 'subset', 1)
-        sample_df.to_csv("random_burst_dataset.csv", index= False)
+        base_time = datetime.now().timestamp()
+        burst_duration_s = burst_duration.total_seconds()
+        normal_interval_s = normal_interval.total_seconds()
+
+        # Each arrival event is either a single normal task or a burst of 1..max_tasks_in_burst tasks;
+        # num_qtasks events always cover at least num_qtasks tasks
+        is_burst = self.rng.random(num_qtasks) < burst_chance
+        burst_sizes = self.rng.integers(1, max_tasks_in_burst + 1, num_qtasks)
+        in_burst = np.repeat(is_burst, np.where(is_burst, burst_sizes, 1))[:num_qtasks]
+
+        # Gap after each task: random within a burst, fixed otherwise
+        burst_deltas = self.rng.uniform(0, burst_duration_s, num_qtasks)
+        deltas = np.where(in_burst, burst_deltas, normal_interval_s)
+        timestamps = base_time + np.cumsum(deltas) - deltas
+
+        sample_df = self._build_workload(timestamps)
+        if persist:
+            _write_csv(sample_df, "random_burst_dataset.csv")
         return sample_df
 
-    def map_invocation_times(self, invocation_times: pd.DataFrame) -> pd.DataFrame:
+    def map_invocation_times(self, invocation_times: pd.DataFrame, persist: bool = False) -> pd.DataFrame:
         """
         Map the available quantum tasks dataset with the user's invocation time dataset to generate a quantum workload dataset.
 
         Parameters:
         - invocation_times: A DataFrame containing the invocation times.
+        - persist: Whether to also write the dataset to a CSV file.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        num_qtasks = len(invocation_times)
-        sample_df = self.available_datasets.sample(n=num_qtasks, replace=True).reset_index(drop=True)
-        
         # Ensure the invocation_times DataFrame has a 'timestamp' column
         if 'timestamp' not in invocation_times.columns:
             raise ValueError("The invocation times DataFrame must contain a 'timestamp' column.")
-        
-        sample_df['timestamp'] = invocation_times['timestamp']
-        sample_df.insert(0, 'subset', 1)
-        sample_df.to_csv("map_invocation_times_dataset.csv", index = False)
+
+        sample_df = self._build_workload(invocation_times['timestamp'].to_numpy())
+        if persist:
+            _write_csv(sample_df, "map_invocation_times_dataset.csv")
         return sample_df
 
 
-    def generate_workload(self, scenario: int, **kwargs) -> pd.DataFrame:
+    def generate_workload(self, scenario: int, persist: bool = False, **kwargs) -> pd.DataFrame:
         """
         Generate a workload dataset based on the chosen scenario.
 
         Parameters:
         - scenario: The scenario to simulate (1-6).
+        - persist: Whether to also write the dataset to a CSV file.
         - kwargs: Additional parameters for the chosen scenario.
 
         Returns:
         - A DataFrame with the generated quantum workload dataset.
         """
-        if scenario == 1:
-            return self.generate_bursty_dataset(**kwargs)
-        elif scenario == 2:
-            return self.simulate_regular_spikes(**kwargs)
-        elif scenario == 3:
-            return self.simulate_ramp_up(**kwargs)
-        elif scenario == 4:
-            return self.simulate_ramp_down(**kwargs)
-        elif scenario == 5:
-            return self.generate_random_bursts(**kwargs)
-        elif scenario == 6:
-            return self.map_invocation_times(**kwargs)
-        else:
-            raise ValueError("Invalid scenario number. Choose a scenario between 1 and 6.")
+        try:
+            generate = self._dispatch[scenario]
+        except (KeyError, TypeError):
+            raise ValueError("Invalid scenario number. Choose a scenario between 1 and 6.") from None
+        return generate(persist=persist, **kwargs)
+
+
+# Source dataset loaded by _init_worker in each process of the example's worker pool
+_worker_datasets: Optional[pd.DataFrame] = None
+
+
+def _init_worker(dataset_path: str) -> None:
+    """
+    Load the available datasets once per worker process.
+
+    Parameters:
+    - dataset_path: Path to the available quantum tasks dataset CSV.
+    """
+    global _worker_datasets
+    _worker_datasets = _read_csv(dataset_path)
+
+
+def _run_scenario(task: tuple) -> pd.DataFrame:
+    """
+    Generate and persist one scenario inside a worker process.
+
+    Parameters:
+    - task: A (scenario, kwargs, seed) tuple; the seed gives each worker an independent random stream.
+
+    Returns:
+    - A DataFrame with the generated quantum workload dataset.
+    """
+    if _worker_datasets is None:
+        raise RuntimeError("No dataset loaded in this process; run _run_scenario in a pool started with initializer=_init_worker.")
+    scenario, kwargs, seed = task
+    qwg = QuantumWorkloadGenerator(_worker_datasets, rng=np.random.default_rng(seed))
+    return qwg.generate_workload(scenario, persist=True, **kwargs)
+
+
 # Example usage
 if __name__ == "__main__":
 
-    available_datasets = pd.read_csv("qdataset_indep_2-50q.csv")
-
-    qwg = QuantumWorkloadGenerator(available_datasets)
-    
-    # 1. Generate a dataset with a sudden burst of tasks.
-    #burst_duration = timedelta(minutes=1)
-    #low_activity_interval = timedelta(minutes=10)
-    #burst_tasks = 40
-    #num_qtasks = 50
-    #generated_dataset = qwg.generate_bursty_dataset(num_qtasks, burst_duration, burst_tasks, low_activity_interval)
-    
-
-    # 2. Generate a dataset with a sudden burst of tasks followed by low activity.
-    burst_duration = timedelta(minutes=1)
-    low_activity_interval = timedelta(minutes=5)
-    burst_tasks = 10
+    dataset_path = "qdataset_indep_2-50q.csv"
     num_qtasks = 25
-    generated_dataset = qwg.generate_bursty_dataset(num_qtasks, burst_duration, burst_tasks, low_activity_interval)
-    
-
-    # 3. Simulate regular spikes in the arrival rate of tasks at fixed intervals.
-    spike_interval = timedelta(minutes=15)
-    normal_interval = timedelta(minutes=10)
-    spike_tasks = 5
-    generated_dataset = qwg.simulate_regular_spikes(num_qtasks, spike_interval, spike_tasks, normal_interval)
-    
-
-    # 4. Simulate ramp-up timestamps where the interval between tasks decreases over time.
-    initial_interval = timedelta(minutes=10)
-    final_interval = timedelta(seconds=30)
-    generated_dataset = qwg.simulate_ramp_up(num_qtasks, initial_interval, final_interval)
-    
-
-    # 5. Simulate ramp-down timestamps where the interval between tasks increases over time.
-    initial_interval = timedelta(seconds=30)
-    final_interval = timedelta(minutes=10)
-    generated_dataset = qwg.simulate_ramp_down(num_qtasks, initial_interval, final_interval)
-   
-
-    # 6. Generate timestamps with random bursts of high task arrivals.
-    burst_chance = 0.2
-    max_tasks_in_burst = 10
-    normal_interval = timedelta(minutes=10)
-    generated_dataset = qwg.generate_random_bursts(num_qtasks, burst_chance, burst_duration, max_tasks_in_burst, normal_interval)
-    
+
+    # The scenarios share no state, so each one runs in its own worker process.
+    tasks = [
+        # 1. Generate a dataset with a sudden burst of tasks followed by low activity.
+        (1, dict(num_qtasks=num_qtasks, burst_duration=timedelta(minutes=1), burst_tasks=10, low_activity_interval=timedelta(minutes=5))),
+        # 2. Simulate regular spikes in the arrival rate of tasks at fixed intervals.
+        (2, dict(num_qtasks=num_qtasks, spike_interval=timedelta(minutes=15), spike_tasks=5, normal_interval=timedelta(minutes=10))),
+        # 3. Simulate ramp-up timestamps where the interval between tasks decreases over time.
+        (3, dict(num_qtasks=num_qtasks, initial_interval=timedelta(minutes=10), final_interval=timedelta(seconds=30))),
+        # 4. Simulate ramp-down timestamps where the interval between tasks increases over time.
+        (4, dict(num_qtasks=num_qtasks, initial_interval=timedelta(seconds=30), final_interval=timedelta(minutes=10))),
+        # 5. Generate timestamps with random bursts of high task arrivals.
+        (5, dict(num_qtasks=num_qtasks, burst_chance=0.2, burst_duration=timedelta(minutes=1), max_tasks_in_burst=10, normal_interval=timedelta(minutes=10))),
+    ]
+    seeds = np.random.SeedSequence().spawn(len(tasks))
+
+    # No more workers than tasks, since every worker re-reads the source CSV
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(dataset_path,)) as executor:
+        generated_datasets = list(executor.map(_run_scenario, [(scenario, kwargs, seed) for (scenario, kwargs), seed in zip(tasks, seeds)]))